@@ -1,4 +1,100 @@
-import matplotlib.pyplot as plt
+from functools import lru_cache
+from types import MappingProxyType
+
+import numpy as np
+
+# matplotlib.pyplot, imported on first plot (see _get_plt)
+_plt = None
+
+def _get_plt():
+    """
+    Returns matplotlib.pyplot, importing it on first use so that computing
+    site factors and spectra does not pay matplotlib's import cost.
+    """
+    global _plt
+    if _plt is None:
+        import matplotlib.pyplot as plt
+        _plt = plt
+    return _plt
+
+# Site factor tables, built once at import and shared by every instance.
+# Each table is a 3 x N array with one row per ground type.
+
+# Row of each ground type in the site factor tables
+_GT_INDEX = {'I': 0, 'II': 1, 'III': 2}
+
+# Reference PGA site factors (Fpga) over the reference PGA values
+_PGA_VALUES = np.array([0.00, 0.10, 0.20, 0.30, 0.40, 0.50, 0.80])
+_FPGA = np.array([
+    [1.2, 1.2, 1.2, 1.1, 1.1, 1.0, 1.0],
+    [1.6, 1.6, 1.4, 1.2, 1.0, 0.9, 0.85],
+    [2.5, 2.5, 1.7, 1.2, 0.9, 0.8, 0.75]
+])
+# Same factors keyed by ground type, then by PGA (exposed read-only as
+# SeismicSiteFactor.site_factors)
+_PGA_SITE_FACTORS = MappingProxyType({
+    gt: MappingProxyType(dict(zip(_PGA_VALUES.tolist(), _FPGA[i].tolist())))
+    for gt, i in _GT_INDEX.items()
+})
+
+# Short-period site coefficients (Fa) over the reference Ss values
+_SS_VALUES = np.array([0.25, 0.50, 0.75, 1.00, 1.25, 2.00])
+_FA = np.array([
+    [1.2, 1.2, 1.1, 1.0, 1.0, 1.0],
+    [1.6, 1.4, 1.2, 1.0, 0.9, 0.85],
+    [2.5, 1.7, 1.2, 0.9, 0.8, 0.75]
+])
+
+# Long-period site coefficients (Fv) over the reference S1 values
+_S1_VALUES = np.array([0.10, 0.20, 0.30, 0.40, 0.50, 0.80])
+_FV = np.array([
+    [1.7, 1.6, 1.5, 1.4, 1.4, 1.4],
+    [2.4, 2.0, 1.8, 1.6, 1.5, 1.5],
+    [3.5, 3.2, 2.8, 2.4, 2.4, 2.0]
+])
+
+def _make_interpolator(name, reference_values, factors):
+    """
+    Generates a piecewise-linear interpolator specialized to one fixed table.
+
+    The breakpoints, factors and segment slopes are written into the function
+    source as constants, so a call is a short chain of comparisons followed by
+    one multiply-add. Values outside the table clamp to the boundary factors,
+    as in interpolate_factor.
+
+    Args:
+        name (str): Name of the generated function.
+        reference_values (sequence of float): Sorted reference points.
+        factors (sequence of float): Corresponding factor values.
+
+    Returns:
+        function: f(value) -> float.
+    """
+    xs = [float(x) for x in reference_values]
+    ys = [float(y) for y in factors]
+
+    lines = [f"def {name}(x):", f"    if x <= {xs[0]!r}: return {ys[0]!r}"]
+    for i in range(1, len(xs)):
+        slope = (ys[i] - ys[i - 1]) / (xs[i] - xs[i - 1])
+        lines.append(f"    if x < {xs[i]!r}: return {ys[i - 1]!r} + (x - {xs[i - 1]!r}) * {slope!r}")
+    lines.append(f"    return {ys[-1]!r}")
+
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace[name]
+
+# Specialized interpolators keyed by table name, then by ground type
+_INTERPOLATORS = {
+    name: {
+        gt: _make_interpolator(f"_{name}_{gt}", reference_values, table[i])
+        for gt, i in _GT_INDEX.items()
+    }
+    for name, reference_values, table in (
+        ("fpga", _PGA_VALUES, _FPGA),
+        ("fa", _SS_VALUES, _FA),
+        ("fv", _S1_VALUES, _FV),
+    )
+}
 
 class SeismicSiteFactor:
     """
@@ -9,9 +105,12 @@ class SeismicSiteFactor:
         pga (float): Peak ground acceleration (PGA).
         ss (float): Spectral acceleration at 0.2s (short period).
         s1 (float): Spectral acceleration at 1.0s (long period).
-        site_factors (dict): Dictionary of reference PGA site factors for each ground type.
+        site_factors (mapping): Read-only mapping of reference PGA site factors for each
+                                ground type, shared by all instances.
     """
 
+    site_factors = _PGA_SITE_FACTORS
+
     def __init__(self, ground_type, pga=None, ss=None, s1=None):
         """
         Initializes the class with the site ground type and optional values for pga, ss, and s1.
@@ -43,17 +142,11 @@ class SeismicSiteFactor:
         self.ss = ss
         self.s1 = s1
 
-        # Dictionary of site factors keyed by ground type
-        self.site_factors = {
-            'I': {"0.00": 1.2, "0.10": 1.2, "0.20": 1.2, "0.30": 1.1, "0.40": 1.1, "0.50": 1.0, "0.80": 1.0},
-            'II': {"0.00": 1.6, "0.10": 1.6, "0.20": 1.4, "0.30": 1.2, "0.40": 1.0, "0.50": 0.9, "0.80": 0.85},
-            'III': {"0.00": 2.5, "0.10": 2.5, "0.20": 1.7, "0.30": 1.2, "0.40": 0.9, "0.50": 0.8, "0.80": 0.75}
-        }
-
     def interpolate_site_factor(self):
         """
         Interpolates the site factor for self.pga using the ground_type's
-        dictionary in self.site_factors, via the interpolate_factor method.
+        reference PGA site factors, via the cached _site_factor lookup and
+        the interpolator generated for that table.
 
         Returns:
             float or None: Interpolated site factor if valid;
@@ -65,18 +158,11 @@ class SeismicSiteFactor:
         if self.pga is None:
             raise ValueError("Cannot interpolate site factor because 'pga' is None.")
 
-        # Grab the dictionary for this ground type
-        factors_dict = self.site_factors.get(self.ground_type)
-        if factors_dict is None:
+        if self.ground_type not in _GT_INDEX:
             # Invalid ground_type (extra safety check)
             return None
 
-        # Convert string keys -> float, and map those floats to factor values
-        numeric_pga_keys = sorted([float(k) for k in factors_dict.keys()])
-        factor_values = [factors_dict[f"{k:.2f}"] for k in numeric_pga_keys]
-
-        # Use the static interpolation method
-        return self.interpolate_factor(self.pga, numeric_pga_keys, factor_values)
+        return _site_factor("fpga", self.ground_type, self.pga)
 
     def get_site_factor_fa(self):
         """
@@ -91,14 +177,7 @@ class SeismicSiteFactor:
         if self.ss is None:
             raise ValueError("Cannot compute Fa because 'ss' is None.")
 
-        fa_table = {
-            'I': [1.2, 1.2, 1.1, 1.0, 1.0, 1.0],
-            'II': [1.6, 1.4, 1.2, 1.0, 0.9, 0.85],
-            'III': [2.5, 1.7, 1.2, 0.9, 0.8, 0.75]
-        }
-        ss_values = [0.25, 0.50, 0.75, 1.00, 1.25, 2.00]
-
-        return self.interpolate_factor(self.ss, ss_values, fa_table[self.ground_type])
+        return _site_factor("fa", self.ground_type, self.ss)
 
     def get_site_factor_fv(self):
         """
@@ -113,46 +192,84 @@ class SeismicSiteFactor:
         if self.s1 is None:
             raise ValueError("Cannot compute Fv because 's1' is None.")
 
-        fv_table = {
-            'I': [1.7, 1.6, 1.5, 1.4, 1.4, 1.4],
-            'II': [2.4, 2.0, 1.8, 1.6, 1.5, 1.5],
-            'III': [3.5, 3.2, 2.8, 2.4, 2.4, 2.0]
-        }
-        s1_values = [0.10, 0.20, 0.30, 0.40, 0.50, 0.80]
-
-        return self.interpolate_factor(self.s1, s1_values, fv_table[self.ground_type])
+        return _site_factor("fv", self.ground_type, self.s1)
 
     @staticmethod
     def interpolate_factor(value, reference_values, factors):
         """
         Performs linear interpolation (or direct boundary lookup) for `value`.
+
+        `value` may also be an array of query points, in which case the whole
+        batch is interpolated in a single call.
         
         Args:
-            value (float): The input value to interpolate.
+            value (float or array_like): The input value(s) to interpolate.
             reference_values (list of float): Sorted list of reference points.
             factors (list of float): List of corresponding factor values.
 
         Returns:
-            float: Interpolated or boundary factor.
+            float or numpy.ndarray: Interpolated or boundary factor(s); a float
+                                    for a scalar value, else an array of the
+                                    same shape as value.
         """
-        # Check lower and upper boundaries
-        if value <= reference_values[0]:
-            return factors[0]
-        if value >= reference_values[-1]:
-            return factors[-1]
-
-        # Linear interpolation within the range
-        for i in range(len(reference_values) - 1):
-            if reference_values[i] <= value < reference_values[i + 1]:
-                # Linear interpolation formula
-                return factors[i] + (
-                    (value - reference_values[i]) *
-                    (factors[i + 1] - factors[i]) /
-                    (reference_values[i + 1] - reference_values[i])
-                )
-
-        # Fallback to last factor (should never reach here if lists match up)
-        return factors[-1]
+        # np.interp locates the segment with a binary search and clamps
+        # values outside the table to the boundary factors
+        result = np.interp(value, reference_values, factors)
+        if np.ndim(value) == 0:
+            return float(result)
+        return result
+
+# Site factors are deterministic in (table, ground_type, value), and design
+# workflows query the same triple repeatedly, so the lookup is memoized.
+
+@lru_cache(maxsize=1024)
+def _site_factor(name, ground_type, value):
+    """
+    Cached lookup backing the SeismicSiteFactor getters.
+
+    Args:
+        name (str): Table name, 'fpga', 'fa' or 'fv'.
+        ground_type (str): Site classification ('I', 'II', or 'III').
+        value (float): PGA, Ss or S1 to interpolate at.
+
+    Returns:
+        float: Interpolated site factor.
+
+    Raises:
+        KeyError: If name or ground_type is unknown.
+    """
+    return _INTERPOLATORS[name][ground_type](value)
+
+@lru_cache(maxsize=256)
+def _design_response_spectrum(A_s, S_DS, S_D1, T_0, max_period, step):
+    """
+    Cached spectrum backing SeismicDesignResponse.generate_design_response_spectrum.
+    Returns read-only (periods, accelerations) arrays.
+    """
+    # Ramp slope is constant over the spectrum, so divide once up front
+    # (the ramp branch is never reached when T_0 is 0)
+    ramp_slope = (S_DS - A_s) / T_0 if T_0 > 0 else 0.0
+
+    # Periods 0, step, 2*step, ... up to max_period, rounded to 5 decimals
+    n_periods = int(np.floor(max_period / step + 1e-9)) + 1
+    periods = np.round(step * np.arange(max(n_periods, 0)), 5)
+
+    # Optional: linear ramp from A_s (at t=0) up to S_DS (at t=T_0).
+    ramp = (periods > 0) & (periods < T_0)
+    # For T>1 (and past the ramp), switch to the decaying branch
+    decay = (periods > 1.0) & ~ramp
+
+    # Plateau at S_DS everywhere else
+    accelerations = np.full_like(periods, S_DS)
+    accelerations[ramp] = A_s + ramp_slope * periods[ramp]
+    accelerations[decay] = S_D1 / periods[decay]
+    #  Avoid divide-by-zero
+    accelerations[periods == 0] = A_s
+
+    periods.setflags(write=False)
+    accelerations.setflags(write=False)
+
+    return periods, accelerations
 
 class SeismicDesignResponse:
     """
@@ -230,6 +347,8 @@ class SeismicDesignResponse:
         A_s = F_pga * PGA
         S_DS = F_a * S_s
         S_D1 = F_v * S_1
+
+        Returns periods and accelerations as numpy arrays.
         """
 
         # 1) Compute necessary parameters
@@ -242,40 +361,15 @@ class SeismicDesignResponse:
         T_s  = self.calculate_ts()     # Usually = S_D1 / S_DS
         T_0  = 0.2 * T_s               # If you want to ramp from T=0 to T_0
 
-        periods = []
-        accelerations = []
-
-        t = 0.0
-        while t <= max_period:
-            periods.append(t)
-
-            if t == 0:
-                #  Avoid divide-by-zero
-                accel = A_s
-
-            elif 0 < t < T_0:
-                # Optional: linear ramp from A_s (at t=0) up to S_DS (at t=T_0).
-                # If you don't want a ramp, just use accel = S_DS
-                slope = (S_DS - A_s) / T_0
-                accel = A_s + slope * t
-
-            elif T_0 <= t <= 1.0:
-                # Plateau at S_DS up to T=1.0
-                accel = S_DS
-
-            else:
-                # For T>1, switch to the decaying branch
-                accel = S_D1 / t
-
-            accelerations.append(accel)
-
-            t = round(t + step, 5)
+        periods, accelerations = _design_response_spectrum(A_s, S_DS, S_D1, T_0, max_period, step)
 
-        return periods, accelerations
+        # Hand out copies so callers cannot modify the cached arrays
+        return periods.copy(), accelerations.copy()
     def plot_design_response_spectrum(self):
         """
         Plots the design response spectrum using matplotlib.
         """
+        plt = _get_plt()
         periods, accelerations = self.generate_design_response_spectrum()
         plt.figure()
         plt.plot(periods, accelerations, 
@@ -9,7 +9,8 @@ setup(
     url='https://github.com/albertp16/apec-py',
     packages=find_packages(),
     install_requires=[
-        'matplotlib'
+        'matplotlib',
+        'numpy'
     ],
     classifiers=[
         'Programming Language :: Python :: 3',
@@ -36,9 +36,93 @@ Ground Type Classification:
     - Type III: 0.6 ≤ TG
 """
 
+import numpy as np
+
+# Upper TG bounds of Type I and Type II, and the type labels they separate
+_TG_THRESHOLDS = [0.2, 0.6]
+_GROUND_TYPES = ("Type I", "Type II", "Type III")
+
+# Default example dataset, rows of [H (m), Vs (m/s)]
+_EXAMPLE_DATA = [
+    [4, 281.25],
+    [2, 290],
+    [15, 301],
+    [6, 291.8333333],
+    [5, 311.8],
+    [19, 330.5263158],
+    [4, 456.25],
+    [1, 481],
+    [1, 740],
+    [1, 679],
+    [3, 938.6666667],
+    [11, 1705.818182]
+]
+
+
+def _classify_core(H, Vs):
+    """
+    Numeric kernel of classify_ground_type.
+
+    Parameters:
+    ----------
+    H, Vs : numpy.ndarray
+        1-D float arrays of layer thickness (m) and shear wave velocity (m/s).
+
+    Returns:
+    -------
+    tuple of numpy.ndarray
+        (Hv, Tg, type_code), where Hv is NaN for layers with Vs == 0 and
+        type_code indexes _GROUND_TYPES.
+    """
+    has_velocity = Vs != 0
+    Hv = np.divide(H, Vs, out=np.full_like(H, np.nan), where=has_velocity)
+    Tg = 4 * np.cumsum(np.where(has_velocity, Hv, 0.0))
+    # One vector compare per threshold, counted down from Type III so that an
+    # undefined (NaN) TG falls into Type III as in the scalar if/elif chain
+    type_ii_min, type_iii_min = _TG_THRESHOLDS
+    type_code = 2 - (Tg < type_ii_min).astype(np.int8) - (Tg < type_iii_min).astype(np.int8)
+
+    return Hv, Tg, type_code
+
+
 def classify_ground_type(data=None):
     """
-    Classifies ground type per cumulative layer and builds a detailed table.
+    Classifies ground type per cumulative layer as parallel columns.
+
+    Parameters:
+    ----------
+    data : list of lists or numpy.ndarray, optional
+        Input data, each row containing [H (m), Vs (m/s)].
+        If None, default example data is used.
+
+    Returns:
+    -------
+    dict of numpy.ndarray
+        Columns 'H', 'Vs', 'Hv' (H/V, NaN where Vs == 0), 'Tg' and
+        'type_code' (0, 1, 2 for Type I, II, III).
+
+    Raises:
+    ------
+    ValueError
+        If data is not a table of [H, Vs] rows.
+    """
+    if data is None:
+        data = _EXAMPLE_DATA
+
+    layers = np.asarray(data, dtype=float)
+    if layers.size == 0:
+        layers = layers.reshape(0, 2)
+    elif layers.ndim != 2 or layers.shape[1] != 2:
+        raise ValueError("data must be a sequence of [H, Vs] rows.")
+    H, Vs = layers[:, 0], layers[:, 1]
+    Hv, Tg, type_code = _classify_core(H, Vs)
+
+    return {'H': H, 'Vs': Vs, 'Hv': Hv, 'Tg': Tg, 'type_code': type_code}
+
+
+def classify_ground_type_aos(data=None):
+    """
+    Row-table form of classify_ground_type, kept for legacy callers.
 
     Parameters:
     ----------
@@ -52,53 +136,40 @@ def classify_ground_type(data=None):
         Table where each row contains [H, Vs, H/V, TG, Ground Type].
     """
     if data is None:
-        # Default example dataset
-        data = [
-            [4, 281.25],
-            [2, 290],
-            [15, 301],
-            [6, 291.8333333],
-            [5, 311.8],
-            [19, 330.5263158],
-            [4, 456.25],
-            [1, 481],
-            [1, 740],
-            [1, 679],
-            [3, 938.6666667],
-            [11, 1705.818182]
-        ]
+        data = _EXAMPLE_DATA
 
+    soa = classify_ground_type(data)
     table = []
-    cumulative_sum = 0.0
+    for (H, Vs), Hv, Tg, code in zip(
+        data, soa['Hv'].tolist(), soa['Tg'].tolist(), soa['type_code'].tolist()
+    ):
+        # Layers with Vs == 0 carry no H/V value
+        table.append([H, Vs, None if Vs == 0 else Hv, Tg, _GROUND_TYPES[code]])
 
-    for H, Vs in data:
-        if Vs == 0:
-            Hv = None
-        else:
-            Hv = H / Vs
-            cumulative_sum += Hv
+    return table
 
-        Tg = 4 * cumulative_sum
 
-        # Ground Type Classification
-        if Tg < 0.2:
-            ground_type = "Type I"
-        elif 0.2 <= Tg < 0.6:
-            ground_type = "Type II"
-        else:
-            ground_type = "Type III"
+def format_table(soa):
+    """
+    Formats the columns returned by classify_ground_type as a text table.
 
-        table.append([H, Vs, Hv, Tg, ground_type])
+    Parameters:
+    ----------
+    soa : dict of numpy.ndarray
+        Result of classify_ground_type.
 
-    return table
+    Returns:
+    -------
+    str
+        Header line followed by one line per layer.
+    """
+    lines = [f"{'H':>3} {'Vs':>10} {'H/V':>15} {'TG = 4*sum':>15} {'Type':>10}"]
+    for H, Vs, Hv, Tg, code in zip(soa['H'], soa['Vs'], soa['Hv'], soa['Tg'], soa['type_code']):
+        lines.append(f"{H:>3g} {Vs:>10.6f} {Hv:>15.12f} {Tg:>15.6f} {_GROUND_TYPES[code]:>10}")
+
+    return "\n".join(lines)
 
 
 if __name__ == "__main__":
     # Example usage: Run as standalone script
-    result_table = classify_ground_type()
-
-    # Table headers
-    print(f"{'H':>3} {'Vs':>10} {'H/V':>15} {'TG = 4*sum':>15} {'Type':>10}")
-    for row in result_table:
-        H, Vs, Hv, Tg, ground_type = row
-        print(f"{H:>3} {Vs:>10.6f} {Hv:>15.12f} {Tg:>15.6f} {ground_type:>10}")
+    print(format_table(classify_ground_type()))